@@ -6,6 +6,11 @@ from datetime import datetime, time
 from city_scrapers_core.constants import BOARD
 from city_scrapers_core.items import Meeting
 
+# Compiled once at import and shared by every DEGC authority spider
+DATE_RE = re.compile(r"[a-z]{3,10}\s+\d{1,2},?\s+\d{4}", flags=re.I)
+WHITESPACE_RE = re.compile(r"\s+")
+TAG_RE = re.compile(r"<[^<]+?>")
+
 
 class DetAuthorityMixin:
     """Mixin for shared behavior on Detroit public authority scrapers"""
@@ -31,10 +36,11 @@ class DetAuthorityMixin:
         page_text = " ".join(response.css(".et_pb_text_inner *::text").extract())
         self._validate_location(page_text)
 
-        events = [
-            i for i in response.css("script").extract() if '"@type":"Event"' in i
-        ][0]
-        events = re.sub("<[^<]+?>", "", events)
+        # Only serialize the script with event data rather than every script on the page
+        events = response.xpath(
+            '//script[contains(., \'"@type":"Event"\')]'
+        ).extract_first()
+        events = TAG_RE.sub("", events)
         events = json.loads(events)
 
         for event in events:
@@ -63,8 +69,13 @@ class DetAuthorityMixin:
     def _parse_prev_meetings(self, response):
         """Parse all previous meetings"""
         link_map = self._parse_prev_links(response)
-        last_year = datetime.today().replace(year=datetime.today().year - 1)
+        today = datetime.today()
+        last_year = today.replace(year=today.year - 1)
+        archive = self.settings.getbool("CITY_SCRAPERS_ARCHIVE")
         for dt, links in link_map.items():
+            # Skip old meetings before building them
+            if dt < last_year and not archive:
+                continue
             link_text = " ".join(link["title"] for link in links)
             meeting = self._set_meeting_defaults(response)
             meeting["start"] = dt
@@ -73,10 +84,6 @@ class DetAuthorityMixin:
             meeting["classification"] = self._parse_classification(meeting)
             meeting["status"] = self._get_status(meeting, text=link_text)
             meeting["id"] = self._get_id(meeting)
-            if meeting["start"] < last_year and not self.settings.getbool(
-                "CITY_SCRAPERS_ARCHIVE"
-            ):
-                continue
             yield meeting
 
     @staticmethod
@@ -119,11 +126,7 @@ class DetAuthorityMixin:
             # Ignore if link date is None or doesn't match start date
             if start.date() != link_date:
                 continue
-            link_title = re.sub(
-                r"\s+",
-                " ",
-                re.sub(r"[a-z]{3,10}\s+\d{1,2},?\s+\d{4}", "", link_text, flags=re.I),
-            ).strip()
+            link_title = WHITESPACE_RE.sub(" ", DATE_RE.sub("", link_text)).strip()
             links.append(
                 {"href": response.urljoin(link.attrib["href"]), "title": link_title}
             )
@@ -137,11 +140,7 @@ class DetAuthorityMixin:
             if not link_date:
                 continue
             link_dt = datetime.combine(link_date, self.default_start_time)
-            link_title = re.sub(
-                r"\s+",
-                " ",
-                re.sub(r"[a-z]{3,10}\s+\d{1,2},?\s+\d{4}", "", link_text, flags=re.I),
-            ).strip()
+            link_title = WHITESPACE_RE.sub(" ", DATE_RE.sub("", link_text)).strip()
             link_map[link_dt].append(
                 {"href": response.urljoin(link.attrib["href"]), "title": link_title}
             )
@@ -150,9 +149,7 @@ class DetAuthorityMixin:
     def _parse_link_text_date(self, link):
         """Parse the text of a link as well as the date (if available)"""
         link_text = " ".join(link.css("*::text").extract()).strip()
-        link_date_match = re.search(
-            r"[a-z]{3,10}\s+\d{1,2},?\s+\d{4}", link_text, flags=re.I
-        )
+        link_date_match = DATE_RE.search(link_text)
         if not link_date_match:
             return link_text, None
         link_date_str = link_date_match.group().replace(",", "")
@@ -85,7 +85,8 @@ class DetRetirementMixin:
                 )
             )
 
-        last_year = datetime.today().replace(year=datetime.today().year - 1)
+        today = datetime.today()
+        last_year = today.replace(year=today.year - 1)
         for meeting in meetings:
             if meeting["start"] < last_year and not self.settings.getbool(
                 "CITY_SCRAPERS_ARCHIVE"
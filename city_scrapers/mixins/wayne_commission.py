@@ -15,8 +15,10 @@ class WayneCommissionMixin:
     description = ""
 
     def parse(self, response):
-        for item in self._parse_entries(response):
-            start = self._parse_start(item)
+        # Calendar shows only meetings in current year, so read the clock once
+        year = datetime.now().year
+        for item in self._parse_entries(response, year):
+            start = self._parse_start(item, year)
             if not start:
                 continue
             meeting = Meeting(
@@ -36,7 +38,7 @@ class WayneCommissionMixin:
             meeting["status"] = self._get_status(meeting, text=status_str)
             yield meeting
 
-    def _parse_entries(self, response):
+    def _parse_entries(self, response, year):
         return response.xpath("//tbody/tr[child::td/text()]")
 
     @staticmethod
@@ -50,16 +52,15 @@ class WayneCommissionMixin:
                 documents.append({"href": response.urljoin(url), "title": note})
         return documents
 
-    def _parse_start(self, item):
+    def _parse_start(self, item, year):
         """
         Parse start date and time.
         """
-        # Calendar shows only meetings in current year.
-        year_str = datetime.now().year
         # Dateparse can't always handle the inconsistent dates, so
         # let's normalize them using scrapy's regular expressions.
-        month_match = item.xpath(".//td[2]/text()").re(r"[a-zA-Z]{3}")
-        day_match = item.xpath(".//td[2]/text()").re(r"\d+")
+        date_text = item.xpath(".//td[2]/text()")
+        month_match = date_text.re(r"[a-zA-Z]{3}")
+        day_match = date_text.re(r"\d+")
         if len(month_match) == 0 or len(day_match) == 0:
             return
         month_str = month_match[0]
@@ -69,9 +70,7 @@ class WayneCommissionMixin:
             .replace(";", ":")
             .replace("p.n.", "p.m.")
         )
-        return dateparse(
-            "{0} {1} {2} {3}".format(month_str, day_str, year_str, time_str)
-        )
+        return dateparse("{0} {1} {2} {3}".format(month_str, day_str, year, time_str))
 
     def _parse_status(self, item, meeting):
         """
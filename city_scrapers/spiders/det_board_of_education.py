@@ -11,6 +11,8 @@ class DetBoardOfEducationSpider(CityScrapersSpider):
     name = "det_board_of_education"
     agency = "Detroit Public Schools Community District"
     timezone = "America/Detroit"
+    # Looked up once rather than for every start and end time
+    local_tz = pytz.timezone(timezone)
     start_urls = ["https://www.detroitk12.org/site/handlers/icalfeed.ashx?MIID=14864"]
 
     def parse(self, response):
@@ -70,8 +72,7 @@ class DetBoardOfEducationSpider(CityScrapersSpider):
     def _parse_datetime(self, dt_str):
         """Parse iCal datetime string in UTC into a naive datetime in local time"""
         dt = datetime.strptime(dt_str, "%Y%m%dT%H%M%SZ").replace(tzinfo=pytz.utc)
-        tz = pytz.timezone(self.timezone)
-        return dt.astimezone(tz).replace(tzinfo=None)
+        return dt.astimezone(self.local_tz).replace(tzinfo=None)
 
     def _parse_location(self, item):
         """Parse or generate location."""
@@ -21,7 +21,8 @@ class DetLandBankSpider(CityScrapersSpider):
         ).extract_first()
         entries = json.loads(data.strip()[:-1])
 
-        last_year = datetime.today().replace(year=datetime.today().year - 1)
+        today = datetime.today()
+        last_year = today.replace(year=today.year - 1)
         for item in entries:
             start = self._parse_start(item)
             if start < last_year and not self.settings.getbool("CITY_SCRAPERS_ARCHIVE"):
@@ -30,7 +31,7 @@ class DetLandBankSpider(CityScrapersSpider):
                 title=item["title_tmp"],
                 description=item["content"],
                 classification=self._parse_classification(item),
-                start=self._parse_start(item),
+                start=start,
                 end=None,
                 time_notes="",
                 all_day=False,
@@ -86,16 +86,15 @@ class DetRegionalConventionSpider(CityScrapersSpider):
         time_match = re.search(
             r"\b([0-9]|1[0-2]):?([0-5][0-9])?\s?(am|pm|AM|PM)\b", input_str
         )
-        try:
-            time_obj = parse(time_match.group())
-            time_obj = time_obj.time()
         # default to 12:00 AM if no time found
-        except ValueError:
-            time_obj = time(0, 0)
-        except AttributeError:
-            time_obj = time(0, 0)
-
-        return datetime.combine(date_obj, time_obj)
+        if not time_match:
+            return datetime.combine(date_obj, time(0, 0))
+        # build the time from the matched groups rather than re-parsing the string
+        hour_str, minute_str, meridian = time_match.groups()
+        hour = int(hour_str) % 12
+        if meridian.lower() == "pm":
+            hour += 12
+        return datetime.combine(date_obj, time(hour, int(minute_str or 0)))
 
     def _parse_location(self, info_str):
         """
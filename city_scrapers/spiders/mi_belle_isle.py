@@ -23,6 +23,8 @@ class MiBelleIsleSpider(CityScrapersSpider):
         Change the `_parse_title`, `_parse_start`, etc methods to fit your scraping
         needs.
         """
+        # Links are listed separately from meetings, so map them by date once
+        meeting_agendas, meeting_minutes = self._parse_links(response)
         for item in response.xpath("//tbody/tr"):
             # Adapted the combined start and end from chi_city_college
             start, end = self._parse_start_end(item)
@@ -37,7 +39,9 @@ class MiBelleIsleSpider(CityScrapersSpider):
                 time_notes="",
                 all_day=False,
                 location=self._parse_location(item),
-                links=self._match_links(item, start, response),
+                links=self._match_links(
+                    start, response, meeting_agendas, meeting_minutes
+                ),
                 source=response.url,
             )
 
@@ -90,12 +94,13 @@ class MiBelleIsleSpider(CityScrapersSpider):
         }
         if location_name is None:
             return DEFAULT_LOCATION
-        if "flynn" in location_name.lower():
+        name_lower = location_name.lower()
+        if "flynn" in name_lower:
             location_address = (
                 "Intersection of Picnic Way and Loiter Way, "
                 "Belle Isle, Detroit, MI 48207"
             )
-        elif "nature zoo" in location_name.lower():
+        elif "nature zoo" in name_lower:
             location_address = "176 Lakeside Drive, Detroit, MI 48207"
         else:
             location_address = DEFAULT_LOCATION["address"]
@@ -131,11 +136,10 @@ class MiBelleIsleSpider(CityScrapersSpider):
 
         return agendas_dict, minutes_dict
 
-    def _match_links(self, item, start, response):
+    def _match_links(self, start, response, meeting_agendas, meeting_minutes):
         """Match up the links with the date to which they belong"""
         matched_links = []
         meeting_date = start.date()
-        meeting_agendas, meeting_minutes = self._parse_links(response)
 
         if meeting_date in meeting_agendas:
             agenda_url = meeting_agendas[meeting_date]
@@ -1,5 +1,3 @@
-from datetime import datetime
-
 from city_scrapers_core.spiders import CityScrapersSpider
 from dateutil.parser import parse as dateparse
 
@@ -18,14 +16,13 @@ class WayneBuildingAuthoritySpider(WayneCommissionMixin, CityScrapersSpider):
         "address": "500 Griswold St, Detroit, MI 48226",
     }
 
-    def _parse_entries(self, response):
-        current_year = datetime.now().year
+    def _parse_entries(self, response, year):
         current_year_non_empty_rows = response.xpath(
-            '//section[contains(.,"%s")]//tbody/tr[child::td/text()]' % current_year
+            '//section[contains(.,"%s")]//tbody/tr[child::td/text()]' % year
         )
         return current_year_non_empty_rows
 
-    def _parse_start(self, item):
+    def _parse_start(self, item, year):
         """
         Parse start date and time.
         """
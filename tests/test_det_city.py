@@ -1,8 +1,7 @@
 from datetime import datetime, time
-from unittest.mock import MagicMock
 
-import pytest  # noqa
-from freezegun import freeze_time
+import pytest
+from scrapy.http import HtmlResponse
 
 from city_scrapers.mixins import DetCityMixin
 
@@ -11,38 +10,50 @@ class MockDetCitySpider(DetCityMixin):
     agency_cal_id = "1000"
 
 
-def test_start_urls():
-    freezer = freeze_time("2019-02-22")
-    freezer.start()
+def html_response(body):
+    return HtmlResponse(
+        url="https://detroitmi.gov/events/test", body=body, encoding="utf-8"
+    )
+
+
+@pytest.fixture(scope="module")
+def spider():
+    """Shared spider for tests that don't modify its state"""
+    return MockDetCitySpider()
+
+
+class FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2019, 2, 22)
+
+
+def test_start_urls(monkeypatch):
+    # Only the mixin's datetime.now() is used here, so patching it is enough
+    monkeypatch.setattr("city_scrapers.mixins.det_city.datetime", FrozenDatetime)
     spider = MockDetCitySpider()
     assert "2018-10-25" in spider.start_urls[0]
     assert "1000" in spider.start_urls[0]
-    freezer.stop()
 
 
-def test_parse_title():
-    response_mock = MagicMock()
-    title_mock = MagicMock()
-    title_mock.extract_first.return_value = "Test Meeting 2019-01-01"
-    response_mock.css.return_value = title_mock
-    spider = MockDetCitySpider()
-    assert spider._parse_title(response_mock) == "Test Meeting"
+def test_parse_title(spider):
+    response = html_response(
+        '<div class="title"><span>Test Meeting 2019-01-01</span></div>'
+    )
+    assert spider._parse_title(response) == "Test Meeting"
 
 
-def test_parse_start_end():
-    response_mock = MagicMock()
-    dt_mock = MagicMock()
-    dt_mock.extract_first.return_value = "2019-01-01T10:10:10"
-    dt_mock.extract.return_value = ["   \n", " 9:10M - 2:00 p.m."]
-    response_mock.css.return_value = dt_mock
-    spider = MockDetCitySpider()
+def test_parse_start_end(spider):
+    response = html_response(
+        '<div class="date"><time datetime="2019-01-01T10:10:10"></time></div>'
+        '<article class="time">   \n 9:10M - 2:00 p.m.</article>'
+    )
     start = datetime(2019, 1, 1, 9, 10)
-    assert spider._parse_start(response_mock) == start
-    assert spider._parse_end(response_mock, start) == datetime(2019, 1, 1, 14)
+    assert spider._parse_start(response) == start
+    assert spider._parse_end(response, start) == datetime(2019, 1, 1, 14)
 
 
-def test_parse_time_str():
-    spider = MockDetCitySpider()
+def test_parse_time_str(spider):
     assert spider._parse_time_str("from 11:11a.m.") == time(11, 11)
     assert spider._parse_time_str("1pm") == time(13)
 
@@ -11,7 +11,9 @@ from city_scrapers.spiders.det_economic_development_corporation import (
     DetEconomicDevelopmentCorporationSpider,
 )
 
-test_response = file_response(
+from .utils import cached_file_response
+
+test_response = cached_file_response(
     join(dirname(__file__), "files", "det_authority.html"),
     url="https://www.degc.org/public-authorities/",
 )
@@ -26,14 +28,11 @@ test_prev_meetings = file_response(
     ),
     url="https://www.degc.org/edc/",
 )
-freezer = freeze_time("2021-02-10")
-freezer.start()
-
-parsed_items = [item for item in spider._next_meetings(test_response)] + [
-    item for item in spider._parse_prev_meetings(test_prev_meetings)
-]
+with freeze_time("2021-02-10"):
+    parsed_items = [item for item in spider._next_meetings(test_response)] + [
+        item for item in spider._parse_prev_meetings(test_prev_meetings)
+    ]
 parsed_items = sorted(parsed_items, key=lambda x: x["id"], reverse=True)
-freezer.stop()
 
 
 def test_meeting_count():
@@ -11,7 +11,7 @@ from city_scrapers.spiders.det_great_lakes_water_authority import (
 )
 
 with open(
-    join(dirname(__file__), "files", "det_great_lakes_water_authority.json"), "r"
+    join(dirname(__file__), "files", "det_great_lakes_water_authority.json"), "rb"
 ) as f:
     test_response = json.load(f)
 
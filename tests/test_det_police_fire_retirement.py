@@ -11,88 +11,106 @@ from city_scrapers.spiders.det_police_fire_retirement import (
     DetPoliceFireRetirementSpider,
 )
 
-test_response = file_response(
-    join(dirname(__file__), "files", "det_police_fire_retirement.html"),
-    url="http://www.rscd.org/member_resources/board_of_trustees/upcoming_meetings.php",
-)
-test_past_response = file_response(
-    join(dirname(__file__), "files", "det_police_fire_retirement_past.html"),
-    url="http://www.rscd.org/member_resources_/board_of_trustees/past_meeting_agendas___minutes.php",  # noqa
-)
+MEETING_COUNT = 38
 
-spider = DetPoliceFireRetirementSpider()
-spider.settings = Settings(values={"CITY_SCRAPERS_ARCHIVE": False})
 
-freezer = freeze_time("2019-04-05")
-freezer.start()
-spider._parse_past_documents(test_past_response)
-parsed_items = [item for item in spider._parse_meetings(test_response)]
-freezer.stop()
+@pytest.fixture(scope="module")
+def parsed_items():
+    test_response = file_response(
+        join(dirname(__file__), "files", "det_police_fire_retirement.html"),
+        url="http://www.rscd.org/member_resources/board_of_trustees/upcoming_meetings.php",  # noqa
+    )
+    test_past_response = file_response(
+        join(dirname(__file__), "files", "det_police_fire_retirement_past.html"),
+        url="http://www.rscd.org/member_resources_/board_of_trustees/past_meeting_agendas___minutes.php",  # noqa
+    )
+    spider = DetPoliceFireRetirementSpider()
+    spider.settings = Settings(values={"CITY_SCRAPERS_ARCHIVE": False})
+    with freeze_time("2019-04-05"):
+        spider._parse_past_documents(test_past_response)
+        return [item for item in spider._parse_meetings(test_response)]
 
 
-def test_total():
-    assert len(parsed_items) == 38
+def test_total(parsed_items):
+    assert len(parsed_items) == MEETING_COUNT
 
 
-def test_title():
+def test_title(parsed_items):
     assert parsed_items[0]["title"] == "Board of Trustees"
 
 
-def test_description():
+def test_description(parsed_items):
     assert parsed_items[0]["description"] == ""
 
 
-def test_start():
+def test_start(parsed_items):
     assert parsed_items[0]["start"] == datetime(2019, 1, 10, 9, 0)
     assert parsed_items[-1]["start"].year < 2019
 
 
-def test_end():
+def test_end(parsed_items):
     assert parsed_items[0]["end"] is None
 
 
-def test_id():
+def test_id(parsed_items):
     assert (
         parsed_items[0]["id"]
         == "det_police_fire_retirement/201901100900/x/board_of_trustees"
     )
 
 
-def test_status():
-    assert parsed_items[0]["status"] == PASSED
-    assert parsed_items[8]["status"] == TENTATIVE
+@pytest.mark.parametrize("index,status", [(0, PASSED), (8, TENTATIVE)])
+def test_status(parsed_items, index, status):
+    assert parsed_items[index]["status"] == status
 
 
-def test_location():
-    assert parsed_items[0]["location"] == {
-        "name": "Retirement Systems Conference Room",
-        "address": "500 Woodward Ave. Suite 300 Detroit, MI 48226",
-    }
-    assert parsed_items[-1]["location"] == {
-        "name": "Retirement Systems",
+@pytest.mark.parametrize(
+    "index,name",
+    [
+        # Meeting listed on the upcoming page with a room
+        (0, "Retirement Systems Conference Room"),
+        # Meeting only found through past documents
+        (-1, "Retirement Systems"),
+    ],
+)
+def test_location(parsed_items, index, name):
+    assert parsed_items[index]["location"] == {
+        "name": name,
         "address": "500 Woodward Ave. Suite 300 Detroit, MI 48226",
     }
 
 
-def test_source():
+def test_source(parsed_items):
     assert (
         parsed_items[0]["source"]
         == "http://www.rscd.org/member_resources/board_of_trustees/upcoming_meetings.php"  # noqa
     )
 
 
-def test_links():
-    assert parsed_items[0]["links"] == [
-        {"href": "http://www.rscd.org/PFRS_3229A_01102019.pdf", "title": "Agenda"},
-        {"href": "http://www.rscd.org/PFM_3229_011019.pdf", "title": "Minutes"},
-    ]
-    assert parsed_items[8]["links"] == []
+@pytest.mark.parametrize(
+    "index,links",
+    [
+        (
+            0,
+            [
+                {
+                    "href": "http://www.rscd.org/PFRS_3229A_01102019.pdf",
+                    "title": "Agenda",
+                },
+                {"href": "http://www.rscd.org/PFM_3229_011019.pdf", "title": "Minutes"},
+            ],
+        ),
+        (8, []),
+    ],
+)
+def test_links(parsed_items, index, links):
+    assert parsed_items[index]["links"] == links
 
 
-def test_classification():
+def test_classification(parsed_items):
     assert parsed_items[0]["classification"] == BOARD
 
 
-@pytest.mark.parametrize("item", parsed_items)
-def test_all_day(item):
-    assert item["all_day"] is False
+@pytest.mark.parametrize("index", range(MEETING_COUNT))
+def test_all_day(parsed_items, index):
+    assert parsed_items[index]["all_day"] is False
@@ -8,70 +8,72 @@ from freezegun import freeze_time
 
 from city_scrapers.spiders.det_regional_convention import DetRegionalConventionSpider
 
-test_response = file_response(
-    join(dirname(__file__), "files", "det_regional_convention.html"),
-    url="https://www.huntingtonplacedetroit.com/about/detroit-regional-convention-facility-authority/upcoming-drcfa-meetings",  # noqa
-)
-spider = DetRegionalConventionSpider()
-
-freezer = freeze_time(datetime(2024, 5, 9, 13, 8))
-freezer.start()
-
-parsed_items = [item for item in spider.parse(test_response)]
-parsed_item = parsed_items[0]
-freezer.stop()
-
-
-def test_title():
-    assert parsed_item["title"] == "DRCFA Meeting"
-
-
-def test_description():
-    assert parsed_item["description"] == ""
-
-
-def test_start():
-    assert parsed_item["start"] == datetime(2023, 3, 9, 9, 0)
-
-
-def test_end():
-    assert parsed_item["end"] is None
-
+MEETING_COUNT = 59
 
-def test_time_notes():
-    assert parsed_item["time_notes"] == ""
 
-
-def test_id():
-    assert parsed_item["id"] == "det_regional_convention/202303090900/x/drcfa_meeting"
+@pytest.fixture(scope="module")
+def parsed_items():
+    test_response = file_response(
+        join(dirname(__file__), "files", "det_regional_convention.html"),
+        url="https://www.huntingtonplacedetroit.com/about/detroit-regional-convention-facility-authority/upcoming-drcfa-meetings",  # noqa
+    )
+    spider = DetRegionalConventionSpider()
+    with freeze_time(datetime(2024, 5, 9, 13, 8)):
+        return [item for item in spider.parse(test_response)]
 
 
-def test_status():
-    assert parsed_item["status"] == PASSED
+@pytest.fixture(scope="module")
+def parsed_item(parsed_items):
+    return parsed_items[0]
 
 
-def test_location():
-    assert parsed_item["location"] == {
+EXPECTED = {
+    "title": "DRCFA Meeting",
+    "description": "",
+    "start": datetime(2023, 3, 9, 9, 0),
+    "end": None,
+    "time_notes": "",
+    "id": "det_regional_convention/202303090900/x/drcfa_meeting",
+    "status": PASSED,
+    "location": {
         "name": "Huntingdon Place",
         "address": "Huntington Place Detroit Room 252A/B",
-    }
-
-
-def test_source():
-    assert (
-        parsed_item["source"]
-        == "https://www.huntingtonplacedetroit.com/about/detroit-regional-convention-facility-authority/upcoming-drcfa-meetings"  # noqa
-    )
-
-
-def test_links():
-    assert parsed_item["links"] == []
-
-
-def test_classification():
-    assert parsed_item["classification"] == BOARD
-
-
-@pytest.mark.parametrize("item", parsed_items)
-def test_all_day(item):
-    assert item["all_day"] is False
+    },
+    "source": "https://www.huntingtonplacedetroit.com/about/detroit-regional-convention-facility-authority/upcoming-drcfa-meetings",  # noqa
+    "links": [],
+    "classification": BOARD,
+}
+
+
+def test_count(parsed_items):
+    assert len(parsed_items) == MEETING_COUNT
+
+
+def test_parsed_item(parsed_item):
+    for field, expected in EXPECTED.items():
+        assert parsed_item[field] == expected, field
+
+
+@pytest.mark.parametrize("index", range(MEETING_COUNT))
+def test_all_day(parsed_items, index):
+    assert parsed_items[index]["all_day"] is False
+
+
+@pytest.mark.parametrize(
+    "info_str,expected",
+    [
+        (
+            "March 22, 2024 at 12:30 PM in Huntington Place Room 320",
+            datetime(2024, 3, 22, 12, 30),
+        ),
+        (
+            "February 23, 2024 at 1:00 PM in Huntington Place Room 321",
+            datetime(2024, 2, 23, 13, 0),
+        ),
+        ("March 9, 2023 at 9 AM in Huntington Place", datetime(2023, 3, 9, 9, 0)),
+        ("March 9, 2023 at 12:00 AM", datetime(2023, 3, 9, 0, 0)),
+        ("March 9, 2023 in Huntington Place", datetime(2023, 3, 9, 0, 0)),
+    ],
+)
+def test_parse_start(info_str, expected):
+    assert DetRegionalConventionSpider().parse_start(info_str) == expected
@@ -10,7 +10,7 @@ from city_scrapers.spiders.det_water_sewage_department import (
 )
 
 with open(
-    join(dirname(__file__), "files", "det_water_sewage_department.json"), "r"
+    join(dirname(__file__), "files", "det_water_sewage_department.json"), "rb"
 ) as f:
     test_response = json.load(f)
 
@@ -0,0 +1,13 @@
+from functools import cache
+
+from city_scrapers_core.utils import file_response
+
+
+@cache
+def cached_file_response(file_name, url=None):
+    """
+    Return the same response object for a fixture that several test modules share.
+    Scrapy caches the parsed selector on the response, so the file is read and parsed
+    once per test process instead of once per module. Tests must not modify it.
+    """
+    return file_response(file_name, url=url)